@@ -1,7 +1,6 @@
 from test.TestResults import TestResults
 from test.TestCaseResultDto import TestCaseResultDto
 import json
-import requests
 import os
 
 class TestUtils:
@@ -11,6 +10,10 @@ class TestUtils:
 
     @classmethod
     def yakshaAssert(self, test_name, result, test_type):
+        # Imported here so test collection does not pay for requests (and its
+        # urllib3/ssl chain); only an actual result push needs it.
+        import requests
+
         ref = open("../custom.ih", "r")
         customData = ref.read()
         ref.close()
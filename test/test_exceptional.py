@@ -1,322 +1,398 @@
-import unittest
-import os
-import importlib
-import sys
-import io
-import contextlib
-import inspect
-from test.TestUtils import TestUtils
-
-def check_file_exists(filename):
-    """Check if a file exists in the current directory."""
-    return os.path.exists(filename)
-
-def safely_import_module(module_name):
-    """Safely import a module, returning None if import fails."""
-    try:
-        return importlib.import_module(module_name)
-    except ImportError:
-        return None
-
-def check_function_exists(module, function_name):
-    """Check if a function exists in a module."""
-    return hasattr(module, function_name) and callable(getattr(module, function_name))
-
-def safely_call_function(module, function_name, *args, **kwargs):
-    """Safely call a function, returning None if it fails."""
-    if not check_function_exists(module, function_name):
-        return None
-    try:
-        with contextlib.redirect_stdout(io.StringIO()):
-            return getattr(module, function_name)(*args, **kwargs)
-    except Exception:
-        return None
-
-def check_raises_exception(func, args, expected_exception=ValueError):
-    """Check if a function raises the expected exception type."""
-    try:
-        with contextlib.redirect_stdout(io.StringIO()):
-            func(*args)
-        return False  # No exception was raised
-    except expected_exception:
-        return True  # Expected exception was raised
-    except Exception:
-        return False  # Different exception was raised
-
-def is_function_implemented(module, function_name):
-    """Check if a function is actually implemented (not just a pass statement)."""
-    if not check_function_exists(module, function_name):
-        return False
-    
-    try:
-        func = getattr(module, function_name)
-        source = inspect.getsource(func)
-        
-        # Remove everything except the actual implementation
-        lines = source.split('\n')
-        implementation_lines = []
-        in_docstring = False
-        
-        for line in lines:
-            stripped = line.strip()
-            
-            # Skip empty lines
-            if not stripped:
-                continue
-                
-            # Skip function definition line
-            if stripped.startswith('def '):
-                continue
-                
-            # Handle docstrings (both single and multi-line)
-            if stripped.startswith('"""') or stripped.startswith("'''"):
-                if stripped.count('"""') == 2 or stripped.count("'''") == 2:
-                    # Single line docstring, skip it
-                    continue
-                else:
-                    # Start/end of multi-line docstring
-                    in_docstring = not in_docstring
-                    continue
-            
-            # Skip lines inside docstring
-            if in_docstring:
-                continue
-                
-            # Skip comments (including TODO comments)
-            if stripped.startswith('#'):
-                continue
-                
-            # What's left should be actual implementation
-            implementation_lines.append(stripped)
-        
-        # Check if we only have 'pass' statements or no implementation at all
-        if not implementation_lines:
-            return False
-            
-        # If all remaining lines are just 'pass', 'return None', or similar, it's not implemented
-        non_implementation_lines = [line for line in implementation_lines 
-                                  if line not in ['pass', 'return None', 'return', '...', 'raise NotImplementedError()']]
-        return len(non_implementation_lines) > 0
-        
-    except Exception:
-        return True  # If we can't check, assume it's implemented
-
-def load_module_dynamically():
-    """Load the student's module for testing"""
-    return safely_import_module("skeleton")
-
-class TestMinecraftException(unittest.TestCase):
-    """Test class for comprehensive exception handling in the Minecraft Score Converter."""
-    
-    def setUp(self):
-        """Setup test data before each test method."""
-        self.test_obj = TestUtils()
-        self.module_obj = load_module_dynamically()
-        
-        # Check basic requirements once
-        if self.module_obj is None:
-            self.skipTest("Module could not be imported")
-        
-        required_functions = [
-            "convert_string_to_int", "convert_float_to_int", 
-            "convert_hex_to_int", "convert_score_to_string", "create_player_list"
-        ]
-        
-        missing_functions = []
-        for func_name in required_functions:
-            if not check_function_exists(self.module_obj, func_name):
-                missing_functions.append(func_name)
-        
-        if missing_functions:
-            self.skipTest(f"Missing functions: {missing_functions}")
-    
-    def test_comprehensive_exception_handling(self):
-        """Test all exception scenarios across all functions with complete coverage"""
-        try:
-            required_functions = [
-                "convert_string_to_int", "convert_float_to_int", 
-                "convert_hex_to_int", "convert_score_to_string", "create_player_list"
-            ]
-            
-            errors = []
-            
-            # Check if all functions are implemented
-            unimplemented_functions = []
-            for func_name in required_functions:
-                if not is_function_implemented(self.module_obj, func_name):
-                    unimplemented_functions.append(func_name)
-            
-            if unimplemented_functions:
-                errors.append(f"Functions not implemented: {', '.join(unimplemented_functions)}")
-            
-            # === CONVERSION FUNCTION EXCEPTION TESTS ===
-            
-            # STRING CONVERSION EXCEPTION TESTS
-            if is_function_implemented(self.module_obj, "convert_string_to_int"):
-                string_cases = [
-                    # Basic invalid cases
-                    ("", "empty string"), (" ", "space string"), ("abc", "non-numeric string"),
-                    ("12.5", "decimal string"), ("-100", "negative string"), ("+123", "positive sign"),
-                    # Advanced cases
-                    ("0x1F", "hex notation"), ("1e5", "scientific notation"), ("∞", "infinity symbol"),
-                    ("①", "unicode number"), (" 123", "leading space"), ("123 ", "trailing space"),
-                    # Non-string types
-                    (123, "integer input"), (12.5, "float input"), (None, "None input"),
-                    ([], "list input"), ({}, "dictionary input"), (True, "boolean True"),
-                    (False, "boolean False"), (complex(1, 2), "complex number")
-                ]
-                
-                func = getattr(self.module_obj, "convert_string_to_int")
-                for input_val, description in string_cases:
-                    if not check_raises_exception(func, [input_val], ValueError):
-                        errors.append(f"convert_string_to_int should raise ValueError for {description}: {input_val}")
-            
-            # FLOAT CONVERSION EXCEPTION TESTS
-            if is_function_implemented(self.module_obj, "convert_float_to_int"):
-                float_cases = [
-                    # Negative floats (SRS violation)
-                    (-98.7, "negative float"), (-0.1, "small negative"), (-1.0, "negative one"),
-                    (-100.0, "large negative"), (-999.9, "very large negative"),
-                    # Wrong types
-                    ("98.7", "string input"), ("12.5", "numeric string"), ("abc", "non-numeric string"),
-                    (123, "integer input"), (None, "None input"), ([], "list input"),
-                    ({}, "dictionary input"), (True, "boolean True"), (False, "boolean False"),
-                    (complex(1, 2), "complex number"), ("", "empty string"), (" ", "space string"),
-                    ("inf", "infinity string"), ("nan", "NaN string")
-                ]
-                
-                func = getattr(self.module_obj, "convert_float_to_int")
-                for input_val, description in float_cases:
-                    if not check_raises_exception(func, [input_val], ValueError):
-                        errors.append(f"convert_float_to_int should raise ValueError for {description}: {input_val}")
-            
-            # HEX CONVERSION EXCEPTION TESTS
-            if is_function_implemented(self.module_obj, "convert_hex_to_int"):
-                hex_cases = [
-                    # Invalid hex cases
-                    ("", "empty string"), (" ", "space string"), ("XYZ", "invalid characters"),
-                    ("GG", "invalid G"), ("1G", "mixed valid/invalid"), ("-1F", "negative hex"),
-                    # Spaces and special notation
-                    ("FF ", "trailing space"), (" FF", "leading space"), ("F F", "internal space"),
-                    ("0x1F", "hex prefix"), ("12.5", "decimal in hex"),
-                    # Wrong types
-                    (123, "integer input"), (12.5, "float input"), (None, "None input"),
-                    ([], "list input"), ({}, "dictionary input"), (True, "boolean True"),
-                    (False, "boolean False"), (complex(1, 2), "complex number")
-                ]
-                
-                func = getattr(self.module_obj, "convert_hex_to_int")
-                for input_val, description in hex_cases:
-                    if not check_raises_exception(func, [input_val], ValueError):
-                        errors.append(f"convert_hex_to_int should raise ValueError for {description}: {input_val}")
-            
-            # === OUTPUT FUNCTION EXCEPTION TESTS ===
-            
-            # SCORE DISPLAY CONVERSION EXCEPTION TESTS
-            if is_function_implemented(self.module_obj, "convert_score_to_string"):
-                score_cases = [
-                    # String inputs (should be numeric)
-                    ("150", "string input"), ("0", "zero string"), ("abc", "non-numeric string"),
-                    ("12.5", "decimal string"), ("", "empty string"), (" ", "space string"),
-                    # Non-numeric types
-                    (None, "None input"), ([], "list input"), ({}, "dictionary input"),
-                    (True, "boolean True"), (False, "boolean False"), (set(), "set input"),
-                    (tuple(), "tuple input"), (complex(1, 2), "complex number"),
-                ]
-                
-                func = getattr(self.module_obj, "convert_score_to_string")
-                for input_val, description in score_cases:
-                    if not check_raises_exception(func, [input_val], ValueError):
-                        errors.append(f"convert_score_to_string should raise ValueError for {description}: {input_val}")
-            
-            # PLAYER LIST CREATION EXCEPTION TESTS
-            if is_function_implemented(self.module_obj, "create_player_list"):
-                player_cases = [
-                    # Empty/whitespace names
-                    ("", 100, "empty string name"), ("   ", 100, "whitespace name"),
-                    ("\t", 100, "tab name"), ("\n", 100, "newline name"),
-                    # Non-string name types
-                    (None, 100, "None name"), (123, 100, "integer name"), (12.5, 100, "float name"),
-                    ([], 100, "list name"), ({}, 100, "dictionary name"), (True, 100, "boolean True name"),
-                    (False, 100, "boolean False name"), (set(), 100, "set name"), (tuple(), 100, "tuple name"),
-                    (complex(1, 2), 100, "complex number name"),
-                ]
-                
-                func = getattr(self.module_obj, "create_player_list")
-                for name_val, score_val, description in player_cases:
-                    if not check_raises_exception(func, [name_val, score_val], ValueError):
-                        errors.append(f"create_player_list should raise ValueError for {description}: name={name_val}")
-            
-            # === CROSS-FUNCTION TYPE VALIDATION AND ADVANCED EDGE CASES ===
-            
-            # Advanced invalid input types that should fail across multiple functions
-            advanced_invalid_types = [
-                (lambda x: x, "lambda function"),
-                (object(), "generic object"),
-                (set(), "empty set"),
-                ({1, 2, 3}, "non-empty set"),
-                (tuple(), "empty tuple"),
-                ((1, 2, 3), "non-empty tuple"),
-            ]
-            
-            # Test string and hex functions with advanced types
-            for func_name in ["convert_string_to_int", "convert_hex_to_int"]:
-                if is_function_implemented(self.module_obj, func_name):
-                    func = getattr(self.module_obj, func_name)
-                    for invalid_input, type_description in advanced_invalid_types:
-                        if not check_raises_exception(func, [invalid_input], ValueError):
-                            errors.append(f"{func_name} should raise ValueError for {type_description}")
-            
-            # Test float function with advanced types
-            if is_function_implemented(self.module_obj, "convert_float_to_int"):
-                func = getattr(self.module_obj, "convert_float_to_int")
-                for invalid_input, type_description in advanced_invalid_types:
-                    if not check_raises_exception(func, [invalid_input], ValueError):
-                        errors.append(f"convert_float_to_int should raise ValueError for {type_description}")
-            
-            # Test score function with advanced types (excluding valid int and float)
-            if is_function_implemented(self.module_obj, "convert_score_to_string"):
-                func = getattr(self.module_obj, "convert_score_to_string")
-                score_invalid_types = [
-                    (None, "None input"), ([], "list input"), ({}, "dictionary input"),
-                    (True, "boolean input"), (complex(1, 2), "complex number input"),
-                    (set(), "set input"), (tuple(), "tuple input"), ("string", "string input")
-                ]
-                
-                for invalid_input, type_description in score_invalid_types:
-                    if not check_raises_exception(func, [invalid_input], ValueError):
-                        errors.append(f"convert_score_to_string should raise ValueError for {type_description}")
-            
-            # Test player list function with advanced name types
-            if is_function_implemented(self.module_obj, "create_player_list"):
-                func = getattr(self.module_obj, "create_player_list")
-                for invalid_input, type_description in advanced_invalid_types:
-                    if not check_raises_exception(func, [invalid_input, 100], ValueError):
-                        errors.append(f"create_player_list should raise ValueError for {type_description} as name parameter")
-            
-            # SRS-specific validation: negative float validation
-            if is_function_implemented(self.module_obj, "convert_float_to_int"):
-                func = getattr(self.module_obj, "convert_float_to_int")
-                srs_negative_cases = [
-                    (-0.1, "small negative per SRS"), (-1.0, "negative one per SRS"),
-                    (-98.7, "SRS example negative"), (-999.9, "large negative per SRS")
-                ]
-                
-                for negative_val, description in srs_negative_cases:
-                    if not check_raises_exception(func, [negative_val], ValueError):
-                        errors.append(f"convert_float_to_int should raise ValueError for {description}: {negative_val}")
-            
-            # Final assertion
-            if errors:
-                self.test_obj.yakshaAssert("TestComprehensiveExceptionHandling", False, "exception")
-                print("TestComprehensiveExceptionHandling = Failed")
-            else:
-                self.test_obj.yakshaAssert("TestComprehensiveExceptionHandling", True, "exception")
-                print("TestComprehensiveExceptionHandling = Passed")
-                
-        except Exception as e:
-            self.test_obj.yakshaAssert("TestComprehensiveExceptionHandling", False, "exception")
-            print("TestComprehensiveExceptionHandling = Failed")
-
-if __name__ == '__main__':
+import unittest
+import os
+import importlib
+import sys
+import ast
+import inspect
+from test.TestUtils import TestUtils
+
+def check_file_exists(filename):
+    """Check if a file exists in the current directory."""
+    return os.path.exists(filename)
+
+def safely_import_module(module_name):
+    """Safely import a module, returning None if import fails."""
+    try:
+        return importlib.import_module(module_name)
+    except ImportError:
+        return None
+
+def check_function_exists(module, function_name):
+    """Check if a function exists in a module."""
+    return hasattr(module, function_name) and callable(getattr(module, function_name))
+
+class _DevNull:
+    """Write-only stdout sink shared by every silenced call.
+
+    One module-level instance replaces a fresh io.StringIO plus a
+    redirect_stdout context manager per call; nothing here ever needs the
+    captured text, so the bytes are simply dropped.
+    """
+
+    def write(self, *_args):
+        pass
+
+    def flush(self):
+        pass
+
+_DEVNULL = _DevNull()
+
+def safely_call_function(module, function_name, *args, **kwargs):
+    """Safely call a function, returning None if it fails."""
+    if not check_function_exists(module, function_name):
+        return None
+    old_stdout = sys.stdout
+    sys.stdout = _DEVNULL
+    try:
+        return getattr(module, function_name)(*args, **kwargs)
+    except Exception:
+        return None
+    finally:
+        sys.stdout = old_stdout
+
+def check_raises_exception(func, args, expected_exception=ValueError):
+    """Check if a function raises the expected exception type."""
+    old_stdout = sys.stdout
+    sys.stdout = _DEVNULL
+    try:
+        func(*args)
+        return False  # No exception was raised
+    except expected_exception:
+        return True  # Expected exception was raised
+    except Exception:
+        return False  # Different exception was raised
+    finally:
+        sys.stdout = old_stdout
+
+# Memo for is_function_implemented: the comprehensive test probes the same
+# five functions dozens of times, and each miss costs an inspect.getsource
+# read plus a line-by-line parse. One analysis per (module, function) is enough.
+_IMPL_CACHE = {}
+
+def _raises_ve(func, arg):
+    """Single-argument fast path of check_raises_exception for ValueError.
+
+    Skips the *args unpacking and expected-exception parameter of the
+    generic helper; the case loops only ever ask this one question.
+    """
+    old_stdout = sys.stdout
+    sys.stdout = _DEVNULL
+    try:
+        func(arg)
+        return False
+    except ValueError:
+        return True
+    except Exception:
+        return False
+    finally:
+        sys.stdout = old_stdout
+
+def _raises_ve2(func, arg_a, arg_b):
+    """Two-argument variant of _raises_ve for create_player_list."""
+    old_stdout = sys.stdout
+    sys.stdout = _DEVNULL
+    try:
+        func(arg_a, arg_b)
+        return False
+    except ValueError:
+        return True
+    except Exception:
+        return False
+    finally:
+        sys.stdout = old_stdout
+
+def is_function_implemented(module, function_name):
+    """Check if a function is actually implemented (not just a pass statement)."""
+    key = (getattr(module, "__name__", None), function_name)
+    hit = _IMPL_CACHE.get(key)
+    if hit is not None:
+        return hit
+    result = _analyze_function(module, function_name)
+    _IMPL_CACHE[key] = result
+    return result
+
+# Function bodies parsed once per module: ast.parse on the module source
+# replaces inspect.getsource plus a hand-rolled docstring/comment state
+# machine per function, and is correct for multi-line docstrings.
+_AST_BODIES = {}
+
+def _module_fn_bodies(module):
+    """Map function name -> AST statement list, parsed once per module."""
+    name = getattr(module, "__name__", None)
+    bodies = _AST_BODIES.get(name)
+    if bodies is None:
+        tree = ast.parse(inspect.getsource(module))
+        bodies = {
+            node.name: node.body
+            for node in ast.walk(tree)
+            if isinstance(node, ast.FunctionDef)
+        }
+        _AST_BODIES[name] = bodies
+    return bodies
+
+def _is_trivial_stmt(node):
+    """True for statements a bare stub may contain (pass, docstring, ...,
+    return None, raise NotImplementedError)."""
+    if isinstance(node, ast.Pass):
+        return True
+    if isinstance(node, ast.Return):
+        return node.value is None or (
+            isinstance(node.value, ast.Constant) and node.value.value is None)
+    if isinstance(node, ast.Expr):
+        return isinstance(node.value, ast.Constant)
+    if isinstance(node, ast.Raise):
+        exc = node.exc
+        if isinstance(exc, ast.Call):
+            exc = exc.func
+        return isinstance(exc, ast.Name) and exc.id == "NotImplementedError"
+    return False
+
+def _analyze_function(module, function_name):
+    """Uncached body of is_function_implemented."""
+    if not check_function_exists(module, function_name):
+        return False
+    try:
+        body = _module_fn_bodies(module).get(function_name)
+        if body is None:
+            return True  # no Python source body: assume implemented
+        return any(not _is_trivial_stmt(stmt) for stmt in body)
+    except Exception:
+        return True  # If we can't check, assume it's implemented
+
+# Import the student's module once at collection time; every setUp used to
+# re-enter importlib (sys.modules probe + ImportError machinery) per test.
+_CACHED_MODULE = safely_import_module("skeleton")
+
+def load_module_dynamically():
+    """Load the student's module for testing"""
+    return _CACHED_MODULE
+
+# Required-function names as a frozenset so existence checks are a single
+# set difference rather than a per-name loop.
+_REQUIRED_FUNCTIONS = frozenset({
+    "convert_string_to_int", "convert_float_to_int",
+    "convert_hex_to_int", "convert_score_to_string", "create_player_list"
+})
+
+# Exception case tables, hoisted to module scope: built once at import and
+# shared across runs instead of reconstructed as ~100 fresh tuples on every
+# test invocation. Each row is (input, description); the fused table below
+# tags rows with their target function so one loop drives the whole sweep.
+_STRING_CASES = (
+    # Basic invalid cases
+    ("", "empty string"), (" ", "space string"), ("abc", "non-numeric string"),
+    ("12.5", "decimal string"), ("-100", "negative string"), ("+123", "positive sign"),
+    # Advanced cases
+    ("0x1F", "hex notation"), ("1e5", "scientific notation"), ("∞", "infinity symbol"),
+    ("①", "unicode number"), (" 123", "leading space"), ("123 ", "trailing space"),
+    # Non-string types
+    (123, "integer input"), (12.5, "float input"), (None, "None input"),
+    ([], "list input"), ({}, "dictionary input"), (True, "boolean True"),
+    (False, "boolean False"), (complex(1, 2), "complex number")
+)
+
+_FLOAT_CASES = (
+    # Negative floats (SRS violation)
+    (-98.7, "negative float"), (-0.1, "small negative"), (-1.0, "negative one"),
+    (-100.0, "large negative"), (-999.9, "very large negative"),
+    # Wrong types
+    ("98.7", "string input"), ("12.5", "numeric string"), ("abc", "non-numeric string"),
+    (123, "integer input"), (None, "None input"), ([], "list input"),
+    ({}, "dictionary input"), (True, "boolean True"), (False, "boolean False"),
+    (complex(1, 2), "complex number"), ("", "empty string"), (" ", "space string"),
+    ("inf", "infinity string"), ("nan", "NaN string")
+)
+
+_HEX_CASES = (
+    # Invalid hex cases
+    ("", "empty string"), (" ", "space string"), ("XYZ", "invalid characters"),
+    ("GG", "invalid G"), ("1G", "mixed valid/invalid"), ("-1F", "negative hex"),
+    # Spaces and special notation
+    ("FF ", "trailing space"), (" FF", "leading space"), ("F F", "internal space"),
+    ("0x1F", "hex prefix"), ("12.5", "decimal in hex"),
+    # Wrong types
+    (123, "integer input"), (12.5, "float input"), (None, "None input"),
+    ([], "list input"), ({}, "dictionary input"), (True, "boolean True"),
+    (False, "boolean False"), (complex(1, 2), "complex number")
+)
+
+_SCORE_CASES = (
+    # String inputs (should be numeric)
+    ("150", "string input"), ("0", "zero string"), ("abc", "non-numeric string"),
+    ("12.5", "decimal string"), ("", "empty string"), (" ", "space string"),
+    # Non-numeric types
+    (None, "None input"), ([], "list input"), ({}, "dictionary input"),
+    (True, "boolean True"), (False, "boolean False"), (set(), "set input"),
+    (tuple(), "tuple input"), (complex(1, 2), "complex number"),
+)
+
+_PLAYER_CASES = (
+    # Empty/whitespace names
+    ("", 100, "empty string name"), ("   ", 100, "whitespace name"),
+    ("\t", 100, "tab name"), ("\n", 100, "newline name"),
+    # Non-string name types
+    (None, 100, "None name"), (123, 100, "integer name"), (12.5, 100, "float name"),
+    ([], 100, "list name"), ({}, 100, "dictionary name"), (True, 100, "boolean True name"),
+    (False, 100, "boolean False name"), (set(), 100, "set name"), (tuple(), 100, "tuple name"),
+    (complex(1, 2), 100, "complex number name"),
+)
+
+# Cross-function tables for the advanced-type and SRS sweeps, hoisted like
+# the per-function cases above so no literals (including the complex values)
+# are rebuilt per run.
+_ADVANCED_INVALID_TYPES = (
+    (lambda x: x, "lambda function"),
+    (object(), "generic object"),
+    (set(), "empty set"),
+    ({1, 2, 3}, "non-empty set"),
+    (tuple(), "empty tuple"),
+    ((1, 2, 3), "non-empty tuple"),
+)
+
+_SCORE_INVALID_TYPES = (
+    (None, "None input"), ([], "list input"), ({}, "dictionary input"),
+    (True, "boolean input"), (complex(1, 2), "complex number input"),
+    (set(), "set input"), (tuple(), "tuple input"), ("string", "string input")
+)
+
+_SRS_NEGATIVE_CASES = (
+    (-0.1, "small negative per SRS"), (-1.0, "negative one per SRS"),
+    (-98.7, "SRS example negative"), (-999.9, "large negative per SRS")
+)
+
+# Parametrize-style fused table: every row is (func_name, args, description).
+# Splitting these into real pytest nodes would fragment the single graded
+# result this suite reports, so the data is table-driven but the driver stays
+# one unittest method.
+_EXCEPTION_CASES = (
+    tuple(("convert_string_to_int", (val,), desc) for val, desc in _STRING_CASES)
+    + tuple(("convert_float_to_int", (val,), desc) for val, desc in _FLOAT_CASES)
+    + tuple(("convert_hex_to_int", (val,), desc) for val, desc in _HEX_CASES)
+    + tuple(("convert_score_to_string", (val,), desc) for val, desc in _SCORE_CASES)
+    + tuple(("create_player_list", (name, score), desc) for name, score, desc in _PLAYER_CASES)
+)
+
+class TestMinecraftException(unittest.TestCase):
+    """Test class for comprehensive exception handling in the Minecraft Score Converter."""
+
+    # TestUtils is stateless, so one shared instance serves every test method
+    # instead of allocating a fresh one in each setUp.
+    test_obj = TestUtils()
+    
+    @classmethod
+    def setUpClass(cls):
+        """Resolve the student's module and implementation flags once per class.
+
+        A missing module skips the whole class here, at collection time,
+        instead of paying a setUp dispatch and skipTest per test method.
+        """
+        cls._module = load_module_dynamically()
+        if cls._module is None:
+            raise unittest.SkipTest("Module could not be imported")
+        cls._impl_flags = {
+            func_name: is_function_implemented(cls._module, func_name)
+            for func_name in sorted(_REQUIRED_FUNCTIONS)
+        }
+        # Bound references for every implemented function: the case loops use
+        # these instead of repeating getattr per iteration.
+        cls._impl_funcs = {
+            func_name: getattr(cls._module, func_name)
+            for func_name, ok in cls._impl_flags.items() if ok
+        }
+
+    def setUp(self):
+        """Setup test data before each test method."""
+        self.module_obj = self._module
+        
+        present = {
+            func_name for func_name in _REQUIRED_FUNCTIONS
+            if callable(getattr(self.module_obj, func_name, None))
+        }
+        missing_functions = _REQUIRED_FUNCTIONS - present
+        if missing_functions:
+            self.skipTest(f"Missing functions: {sorted(missing_functions)}")
+    
+    def test_comprehensive_exception_handling(self):
+        """Test all exception scenarios across all functions with complete coverage"""
+        try:
+            errors = []
+            
+            # Implementation booleans and bound functions computed once in
+            # setUpClass; every gate below reuses them instead of re-invoking
+            # is_function_implemented or getattr.
+            implemented = self._impl_flags
+            impl_funcs = self._impl_funcs
+            unimplemented_functions = [
+                func_name for func_name, ok in implemented.items() if not ok
+            ]
+            
+            # === CONVERSION FUNCTION EXCEPTION TESTS (single fused pass) ===
+            
+            for func_name, args, description in _EXCEPTION_CASES:
+                func = impl_funcs.get(func_name)
+                if func is None:
+                    continue
+                if len(args) == 1:
+                    raised = _raises_ve(func, args[0])
+                else:
+                    raised = _raises_ve2(func, args[0], args[1])
+                if not raised:
+                    errors.append((func_name, description, args[0]))
+            
+            # === CROSS-FUNCTION TYPE VALIDATION AND ADVANCED EDGE CASES ===
+            
+            # One fused sweep over every function that must reject these types:
+            # each target is resolved once and paired with its trailing args and
+            # message suffix, so the (function, input) product runs in a single
+            # loop instead of four near-identical blocks.
+            advanced_targets = (
+                ("convert_string_to_int", (), ""),
+                ("convert_hex_to_int", (), ""),
+                ("convert_float_to_int", (), ""),
+                ("create_player_list", (100,), " as name parameter"),
+            )
+            for func_name, extra_args, suffix in advanced_targets:
+                func = impl_funcs.get(func_name)
+                if func is None:
+                    continue
+                for invalid_input, type_description in _ADVANCED_INVALID_TYPES:
+                    if extra_args:
+                        raised = _raises_ve2(func, invalid_input, extra_args[0])
+                    else:
+                        raised = _raises_ve(func, invalid_input)
+                    if not raised:
+                        errors.append((func_name, type_description + suffix, invalid_input))
+            
+            # Test score function with advanced types (excluding valid int and float)
+            if "convert_score_to_string" in impl_funcs:
+                func = impl_funcs["convert_score_to_string"]
+                for invalid_input, type_description in _SCORE_INVALID_TYPES:
+                    if not _raises_ve(func, invalid_input):
+                        errors.append(("convert_score_to_string", type_description, invalid_input))
+            
+            # SRS-specific validation: negative float validation
+            if "convert_float_to_int" in impl_funcs:
+                func = impl_funcs["convert_float_to_int"]
+                for negative_val, description in _SRS_NEGATIVE_CASES:
+                    if not _raises_ve(func, negative_val):
+                        errors.append(("convert_float_to_int", description, negative_val))
+            
+            # Final assertion: failures were queued as (function, description,
+            # value) tuples, so message strings are only built on this path.
+            if errors or unimplemented_functions:
+                if unimplemented_functions:
+                    print(f"Functions not implemented: {', '.join(unimplemented_functions)}")
+                for func_name, description, value in errors:
+                    print(f"{func_name} should raise ValueError for {description}: {value!r}")
+                self.test_obj.yakshaAssert("TestComprehensiveExceptionHandling", False, "exception")
+                print("TestComprehensiveExceptionHandling = Failed")
+            else:
+                self.test_obj.yakshaAssert("TestComprehensiveExceptionHandling", True, "exception")
+                print("TestComprehensiveExceptionHandling = Passed")
+                
+        except Exception as e:
+            self.test_obj.yakshaAssert("TestComprehensiveExceptionHandling", False, "exception")
+            print("TestComprehensiveExceptionHandling = Failed")
+
+if __name__ == '__main__':
     unittest.main()
\ No newline at end of file